@@ -315,6 +315,7 @@ class Bloq(metaclass=abc.ABCMeta):
         generalizer: Optional[Union['GeneralizerT', Sequence['GeneralizerT']]] = None,
         keep: Optional[Callable[['Bloq'], bool]] = None,
         max_depth: Optional[int] = None,
+        compute_sigma: bool = True,
     ) -> Tuple['nx.DiGraph', Dict['Bloq', Union[int, 'sympy.Expr']]]:
         """Get the bloq call graph and call totals.
 
@@ -330,6 +331,8 @@ class Bloq(metaclass=abc.ABCMeta):
             keep: If this function evaluates to True for the current bloq, keep the bloq as a leaf
                 node in the call graph instead of recursing into it.
             max_depth: If provided, build a call graph with at most this many layers.
+            compute_sigma: If False, skip summing up the call totals and return an empty `sigma`.
+                Use this if only the graph is needed.
 
         Returns:
             g: A directed graph where nodes are (generalized) bloqs and edge attribute 'n' reports
@@ -340,7 +343,13 @@ class Bloq(metaclass=abc.ABCMeta):
         """
         from qualtran.resource_counting import get_bloq_call_graph
 
-        return get_bloq_call_graph(self, generalizer=generalizer, keep=keep, max_depth=max_depth)
+        return get_bloq_call_graph(
+            self,
+            generalizer=generalizer,
+            keep=keep,
+            max_depth=max_depth,
+            compute_sigma=compute_sigma,
+        )
 
     def bloq_counts(
         self, generalizer: Optional[Union['GeneralizerT', Sequence['GeneralizerT']]] = None
@@ -400,10 +409,10 @@ class Bloq(metaclass=abc.ABCMeta):
             add_controlled: A function with the signature documented above that the system
                 can use to automatically wire up the new control registers.
         """
-        from qualtran import Controlled, CtrlSpec
+        from qualtran._infra.controlled import _DEFAULT_CTRL_SPEC, Controlled
 
         if ctrl_spec is None:
-            ctrl_spec = CtrlSpec()
+            ctrl_spec = _DEFAULT_CTRL_SPEC
 
         return Controlled.make_ctrl_system(self, ctrl_spec=ctrl_spec)
 
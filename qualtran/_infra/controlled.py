@@ -11,6 +11,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import functools
+import math
+import weakref
 from functools import cached_property
 from typing import (
     Any,
@@ -31,6 +34,8 @@ import cirq
 import numpy as np
 from numpy.typing import NDArray
 
+from qualtran.symbolics import is_symbolic
+
 from .bloq import Bloq
 from .data_types import QBit, QDType
 from .gate_with_registers import GateWithRegisters
@@ -62,7 +67,41 @@ def _cvs_convert(
         return (cvs,)
     if all(isinstance(cv, (int, np.integer)) for cv in cvs):
         return (np.asarray(cvs),)
-    return tuple(np.asarray(cv) for cv in cvs)
+    return tuple(map(np.asarray, cvs))
+
+
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def _is_int64_value(val: Any) -> bool:
+    if isinstance(val, float) and val.is_integer():
+        val = int(val)
+    return isinstance(val, (int, np.integer)) and _INT64_MIN <= val <= _INT64_MAX
+
+
+def _serialize_cvs(cvs: NDArray[np.integer]) -> Union[bytes, Tuple[Any, ...]]:
+    """A hashable representation of an array of control values.
+
+    The representation depends only on the values (not on the dtype of `cvs`), so arrays with
+    equal values always serialize equally.
+    """
+    flat = cvs.reshape(-1)
+    if flat.dtype.kind not in 'biu':
+        # e.g. float or object arrays. Canonicalize integer values to int64 and keep anything
+        # else (fractional values, integers that don't fit in 64 bits) exactly.
+        vals = flat.tolist()
+        if not all(_is_int64_value(val) for val in vals):
+            return tuple(vals)
+        flat = np.array([int(val) for val in vals], dtype=np.int64)
+    elif flat.dtype == np.uint64 and flat.size and int(flat.max()) > _INT64_MAX:
+        # Would wrap around in int64; use the same exact form as an object array.
+        return tuple(flat.tolist())
+    if flat.size and flat.min() >= 0 and flat.max() <= 1:
+        # Control bits (by far the most common case) pack 8 to a byte.
+        return np.packbits(flat).tobytes()
+    # Serialize the raw buffer instead of boxing every element into a Python int.
+    return flat.astype(np.int64, copy=False).tobytes()
 
 
 @attrs.frozen(eq=False)
@@ -128,10 +167,7 @@ class CtrlSpec:
     @cached_property
     def num_qubits(self) -> int:
         """Total number of qubits required for control registers represented by this CtrlSpec."""
-        return sum(
-            dtype.num_qubits * int(np.prod(shape))
-            for dtype, shape in zip(self.qdtypes, self.shapes)
-        )
+        return sum(dtype.num_qubits * cv.size for dtype, cv in zip(self.qdtypes, self.cvs))
 
     def activation_function_dtypes(self) -> Sequence[Tuple[QDType, Tuple[int, ...]]]:
         """The data types that serve as input to the 'activation function'.
@@ -164,11 +200,14 @@ class CtrlSpec:
         if len(vals) != self.num_ctrl_reg:
             raise ValueError(f"Incorrect number of inputs for {self}: {len(vals)}.")
 
+        if self.shapes == ((),) and isinstance(vals[0], (int, np.integer)):
+            # Fast path for the common case of a single scalar control value.
+            return bool(vals[0] == self.cvs[0].item())
+
+        # Compare register by register: concatenating registers of different dtypes (e.g. uint64
+        # and int64) would promote the values to float64 and lose precision.
         for val, cv in zip(vals, self.cvs):
-            if isinstance(val, (int, np.integer)):
-                val = np.array(val)
-            else:
-                val = np.asarray(val)
+            val = np.asarray(val)
             if val.shape != cv.shape:
                 raise ValueError(f"Incorrect input shape for {self}: {val.shape} != {cv.shape}.")
             if np.any(val != cv):
@@ -187,10 +226,12 @@ class CtrlSpec:
         return TextBox(f'{cv}')
 
     @cached_property
-    def _cvs_tuple(self) -> Tuple[int, ...]:
-        return tuple(cv for cvs in self.cvs for cv in tuple(cvs.reshape(-1)))
+    def _cvs_tuple(self) -> Tuple[Union[bytes, Tuple[Any, ...]], ...]:
+        return tuple(_serialize_cvs(cvs) for cvs in self.cvs)
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, CtrlSpec):
             return False
 
@@ -200,16 +241,27 @@ class CtrlSpec:
             and other._cvs_tuple == self._cvs_tuple
         )
 
-    def __hash__(self):
+    @cached_property
+    def _hash(self) -> int:
         return hash((self.qdtypes, self.shapes, self._cvs_tuple))
 
+    def __hash__(self):
+        # CtrlSpec is frozen and is frequently used as part of dictionary keys
+        # (e.g. in call graphs), so hash the control values only once.
+        return self._hash
+
+    @cached_property
+    def _cirq_cv_tuple(self) -> Tuple[int, ...]:
+        """The control values as a flat tuple of bits, one per control qubit."""
+        cirq_cv: List[int] = []
+        for qdtype, cv in zip(self.qdtypes, self.cvs):
+            for val in cv.reshape(-1):
+                cirq_cv.extend(qdtype.to_bits(val))
+        return tuple(cirq_cv)
+
     def to_cirq_cv(self) -> cirq.SumOfProducts:
         """Convert CtrlSpec to cirq.SumOfProducts representation of control values."""
-        cirq_cv = []
-        for qdtype, cv in zip(self.qdtypes, self.cvs):
-            for idx in Register('', qdtype, cv.shape).all_idxs():
-                cirq_cv += [*qdtype.to_bits(cv[idx])]
-        return cirq.SumOfProducts([tuple(cirq_cv)])
+        return cirq.SumOfProducts([self._cirq_cv_tuple])
 
     @classmethod
     def from_cirq_cv(
@@ -232,7 +284,7 @@ class CtrlSpec:
         shapes = shapes if shapes is not None else [(len(cv),) if len(cv) > 1 else ()]
 
         # Verify that the given values for qdtypes and shapes are compatible with cv.
-        if sum(dt.num_qubits * np.prod(sh) for dt, sh in zip(qdtypes, shapes)) != len(cv):
+        if sum(dt.num_qubits * math.prod(sh) for dt, sh in zip(qdtypes, shapes)) != len(cv):
             raise ValueError(
                 f"Sum of qubits across {qdtypes=} and {shapes=} should match {len(cv)=}"
             )
@@ -242,13 +294,20 @@ class CtrlSpec:
         bloq_cvs = []
 
         for qdtype, shape in zip(qdtypes, shapes):
-            full_shape = shape + (qdtype.num_qubits,)
-            curr_cvs_bits = np.array(cv[idx : idx + int(np.prod(full_shape))]).reshape(full_shape)
-            curr_cvs = np.apply_along_axis(qdtype.from_bits, -1, curr_cvs_bits)  # type: ignore[arg-type]
+            n_bits = qdtype.num_qubits * math.prod(shape)
+            curr_cvs_bits = np.array(cv[idx : idx + n_bits]).reshape(-1, qdtype.num_qubits)
+            curr_cvs = np.array([qdtype.from_bits(bits) for bits in curr_cvs_bits]).reshape(shape)
             bloq_cvs.append(curr_cvs)
+            idx += n_bits
         return CtrlSpec(tuple(qdtypes), tuple(bloq_cvs))
 
 
+# A shared instance of the default `CtrlSpec()`, so that its hash and cached properties are
+# computed once rather than for every `bloq.controlled()` call without an explicit ctrl spec.
+_DEFAULT_CTRL_SPEC = CtrlSpec()
+_DEFAULT_CTRL_SPEC.cvs[0].flags.writeable = False
+
+
 class AddControlledT(Protocol):
     """The signature for the `add_controlled` callback part of `ctrl_system`.
 
@@ -272,6 +331,37 @@ class AddControlledT(Protocol):
         ...
 
 
+# `Controlled` keeps its dense tensor data (of size 4^n_qubits) only for bloqs this small.
+_MAX_CACHED_TENSOR_QUBITS = 8
+
+_SUBBLOQ_DECOMPOSITIONS: 'weakref.WeakKeyDictionary[Bloq, CompositeBloq]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _decompose_subbloq(bloq: 'Bloq') -> 'CompositeBloq':
+    """Cached `bloq.decompose_bloq()` for use in `Controlled.decompose_bloq`.
+
+    Bloqs are immutable, so the same subbloq controlled in several ways (or used by several
+    higher-level decompositions) shares one decomposition.
+    """
+    try:
+        cbloq = _SUBBLOQ_DECOMPOSITIONS.get(bloq)
+    except TypeError:
+        # Not hashable or not weak-referenceable.
+        return bloq.decompose_bloq()
+    if cbloq is None:
+        cbloq = bloq.decompose_bloq()
+        _SUBBLOQ_DECOMPOSITIONS[bloq] = cbloq
+    return cbloq
+
+
+@functools.lru_cache(maxsize=4096)
+def _ctrl_register(name: str, qdtype: QDType, shape: Tuple[int, ...]) -> Register:
+    """Registers are immutable, so share control registers across `Controlled` instances."""
+    return Register(name=name, dtype=qdtype, shape=shape, side=Side.THRU)
+
+
 def _get_nice_ctrl_reg_names(reg_names: List[str], n: int) -> Tuple[str, ...]:
     """Get `n` names for the ctrl registers that don't overlap with (existing) `reg_names`."""
     if n == 1 and 'ctrl' not in reg_names:
@@ -324,7 +414,8 @@ class Controlled(GateWithRegisters):
         def add_controlled(
             bb: 'BloqBuilder', ctrl_soqs: Sequence['SoquetT'], in_soqs: Dict[str, 'SoquetT']
         ) -> Tuple[Iterable['SoquetT'], Iterable['SoquetT']]:
-            in_soqs |= dict(zip(ctrl_reg_names, ctrl_soqs))
+            for creg_name, ctrl_soq in zip(ctrl_reg_names, ctrl_soqs):
+                in_soqs[creg_name] = ctrl_soq
             new_out_d = bb.add_d(cb, **in_soqs)
 
             # We need to pluck out the `ctrl_soq` from the new out_soqs
@@ -345,10 +436,18 @@ class Controlled(GateWithRegisters):
         n = len(self.ctrl_spec.activation_function_dtypes())
         return _get_nice_ctrl_reg_names(reg_names, n)
 
+    @cached_property
+    def _subbloq_reg_names(self) -> Tuple[str, ...]:
+        return tuple(reg.name for reg in self.subbloq.signature)
+
+    @cached_property
+    def _ctrl_reg_name_to_idx(self) -> Dict[str, int]:
+        return {name: i for i, name in enumerate(self.ctrl_reg_names)}
+
     @cached_property
     def ctrl_regs(self) -> Tuple[Register, ...]:
         return tuple(
-            Register(name=self.ctrl_reg_names[i], dtype=qdtype, shape=shape, side=Side.THRU)
+            _ctrl_register(self.ctrl_reg_names[i], qdtype, shape)
             for i, (qdtype, shape) in enumerate(self.ctrl_spec.activation_function_dtypes())
         )
 
@@ -364,7 +463,7 @@ class Controlled(GateWithRegisters):
         if isinstance(self.subbloq, CompositeBloq):
             cbloq = self.subbloq
         else:
-            cbloq = self.subbloq.decompose_bloq()
+            cbloq = _decompose_subbloq(self.subbloq)
 
         bb, initial_soqs = BloqBuilder.from_signature(self.signature)
         ctrl_soqs: List['SoquetT'] = [initial_soqs[creg_name] for creg_name in self.ctrl_reg_names]
@@ -390,8 +489,8 @@ class Controlled(GateWithRegisters):
 
     def on_classical_vals(self, **vals: 'ClassicalValT') -> Dict[str, 'ClassicalValT']:
         ctrl_vals = [vals[reg_name] for reg_name in self.ctrl_reg_names]
-        other_vals = {reg.name: vals[reg.name] for reg in self.subbloq.signature}
         if self.ctrl_spec.is_active(*ctrl_vals):
+            other_vals = {reg_name: vals[reg_name] for reg_name in self._subbloq_reg_names}
             rets = self.subbloq.on_classical_vals(**other_vals)
             rets |= {
                 reg_name: ctrl_val for reg_name, ctrl_val in zip(self.ctrl_reg_names, ctrl_vals)
@@ -400,6 +499,49 @@ class Controlled(GateWithRegisters):
 
         return vals
 
+    @property
+    def _tensor_data(self) -> np.ndarray:
+        """The (read-only) tensor data for this bloq.
+
+        `add_my_tensors` can be called repeatedly when simulating circuits that contain this
+        bloq, so the subbloq is contracted only once per instance. The dense tensor has
+        4^n_qubits entries, so it is only kept for bloqs with at most
+        `_MAX_CACHED_TENSOR_QUBITS` qubits; larger bloqs recompute it on every call.
+        """
+        data = self.__dict__.get('_tensor_data_cached')
+        if data is not None:
+            return data
+        data = self._compute_tensor_data()
+        n_qubits = self.signature.n_qubits()
+        if not is_symbolic(n_qubits) and n_qubits <= _MAX_CACHED_TENSOR_QUBITS:
+            self.__dict__['_tensor_data_cached'] = data
+        return data
+
+    @cached_property
+    def _active_idx(self) -> Tuple[Union[int, slice], ...]:
+        """The ctrl indexes for which the ctrl is "active".
+
+        Unlike the dense tensor data, this is small, so it is kept even for bloqs whose
+        tensor data is recomputed on every call.
+        """
+        from qualtran.simulation.tensor._tensor_data_manipulation import active_space_for_ctrl_spec
+
+        return active_space_for_ctrl_spec(self.signature, self.ctrl_spec)
+
+    def _compute_tensor_data(self) -> np.ndarray:
+        from qualtran.simulation.tensor._tensor_data_manipulation import (
+            eye_tensor_for_signature,
+            tensor_shape_from_signature,
+        )
+
+        # Create an identity tensor corresponding to the signature of current Bloq
+        data = eye_tensor_for_signature(self.signature)
+        # Put the subbloq tensor at indices where ctrl is active.
+        subbloq_shape = tensor_shape_from_signature(self.subbloq.signature)
+        data[self._active_idx] = self.subbloq.tensor_contract().reshape(subbloq_shape)
+        data.flags.writeable = False
+        return data
+
     def add_my_tensors(
         self,
         tn: 'qtn.TensorNetwork',
@@ -411,23 +553,12 @@ class Controlled(GateWithRegisters):
         import quimb.tensor as qtn
 
         from qualtran._infra.composite_bloq import _flatten_soquet_collection
-        from qualtran.simulation.tensor._tensor_data_manipulation import (
-            active_space_for_ctrl_spec,
-            eye_tensor_for_signature,
-            tensor_shape_from_signature,
-        )
 
-        # Create an identity tensor corresponding to the signature of current Bloq
-        data = eye_tensor_for_signature(self.signature)
+        data = self._tensor_data
         # Verify it has the right shape
         in_ind = _flatten_soquet_collection(incoming[reg.name] for reg in self.signature.lefts())
         out_ind = _flatten_soquet_collection(outgoing[reg.name] for reg in self.signature.rights())
         assert data.shape == tuple(2**soq.reg.bitsize for ind in [out_ind, in_ind] for soq in ind)
-        # Figure out the ctrl indexes for which the ctrl is "active"
-        active_idx = active_space_for_ctrl_spec(self.signature, self.ctrl_spec)
-        # Put the subbloq tensor at indices where ctrl is active.
-        subbloq_shape = tensor_shape_from_signature(self.subbloq.signature)
-        data[active_idx] = self.subbloq.tensor_contract().reshape(subbloq_shape)
         # Add the data to the tensor network.
         tn.add(qtn.Tensor(data=data, inds=out_ind + in_ind, tags=[self.pretty_name(), tag]))
 
@@ -449,12 +580,12 @@ class Controlled(GateWithRegisters):
 
         if reg is None:
             return Text(f'C[{self.subbloq.wire_symbol(reg=None)}]')
-        if reg.name not in self.ctrl_reg_names:
+        i = self._ctrl_reg_name_to_idx.get(reg.name)
+        if i is None:
             # Delegate to subbloq
             return self.subbloq.wire_symbol(reg, idx)
 
         # Otherwise, it's part of the control register.
-        i = self.ctrl_reg_names.index(reg.name)
         return self.ctrl_spec.wire_symbol(i, reg, idx)
 
     def adjoint(self) -> 'Bloq':
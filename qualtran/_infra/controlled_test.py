@@ -26,6 +26,7 @@ from qualtran import (
     Controlled,
     CtrlSpec,
     QBit,
+    QFxp,
     QInt,
     QUInt,
     Register,
@@ -62,6 +63,7 @@ def test_ctrl_spec():
     cspec2 = CtrlSpec(cvs=np.ones(27, dtype=np.intc).reshape((3, 3, 3)))
     assert cspec2.shapes == ((3, 3, 3),)
     assert cspec2 != cspec1
+    assert cspec2 == CtrlSpec(cvs=np.ones(27, dtype=np.int64).reshape((3, 3, 3)))
 
     test_hashable = {cspec1: 1, cspec2: 2}
     assert test_hashable[cspec2] == 2
@@ -73,6 +75,42 @@ def test_ctrl_spec():
     assert cspec3.cvs[0][tuple()] == 234234
 
 
+def test_ctrl_spec_eq_float_cvs():
+    half = CtrlSpec(QFxp(4, 3), cvs=np.array(0.5))
+    assert half != CtrlSpec(QFxp(4, 3), cvs=np.array(0.75))
+    assert half == CtrlSpec(QFxp(4, 3), cvs=np.array(0.5, dtype=object))
+    assert hash(half) == hash(CtrlSpec(QFxp(4, 3), cvs=np.array(0.5, dtype=object)))
+
+    assert CtrlSpec(cvs=np.ones(3)) == CtrlSpec(cvs=np.ones(3, dtype=int))
+    assert CtrlSpec(QInt(8), cvs=np.array([2.0, -3.0])) == CtrlSpec(QInt(8), cvs=[2, -3])
+
+
+def test_ctrl_spec_eq_object_cvs():
+    assert CtrlSpec(cvs=np.array([1, 0], dtype=object)) == CtrlSpec(cvs=np.array([1, 0]))
+    assert CtrlSpec(QUInt(8), cvs=np.array([5, 7], dtype=object)) == CtrlSpec(
+        QUInt(8), cvs=np.array([5, 7], dtype=np.uint8)
+    )
+
+    big = CtrlSpec(QUInt(80), cvs=np.array(2**70 + 1, dtype=object))
+    assert big != CtrlSpec(QUInt(80), cvs=np.array(2**70, dtype=object))
+    assert big == CtrlSpec(QUInt(80), cvs=np.array(2**70 + 1, dtype=object))
+
+
+def test_ctrl_spec_eq_uint64_cvs():
+    val = 2**63 + 5
+    spec = CtrlSpec(QUInt(64), cvs=np.array(val, dtype=np.uint64))
+    assert spec == CtrlSpec(QUInt(64), cvs=np.array(val, dtype=object))
+    assert hash(spec) == hash(CtrlSpec(QUInt(64), cvs=np.array(val, dtype=object)))
+    assert spec != CtrlSpec(QUInt(64), cvs=np.array(val - 2**64, dtype=np.int64))
+
+    # Equal values compare equal regardless of dtype.
+    for dtype in [np.uint8, np.int16, np.uint64, np.int64, float, object]:
+        assert CtrlSpec(QUInt(8), cvs=np.array([3, 200], dtype=dtype)) == CtrlSpec(
+            QUInt(8), cvs=[3, 200]
+        )
+        assert CtrlSpec(cvs=np.array([1, 0, 1], dtype=dtype)) == CtrlSpec(cvs=[1, 0, 1])
+
+
 def test_ctrl_spec_shape():
     c1 = CtrlSpec(QBit(), cvs=1)
     c2 = CtrlSpec(QBit(), cvs=(1,))
@@ -92,7 +130,10 @@ def test_ctrl_spec_to_cirq_cv_roundtrip():
 
     for ctrl_spec in ctrl_specs:
         assert ctrl_spec.to_cirq_cv() == cirq_cv.expand()
-        assert CtrlSpec.from_cirq_cv(cirq_cv, qdtypes=ctrl_spec.qdtypes, shapes=ctrl_spec.shapes)
+        assert (
+            CtrlSpec.from_cirq_cv(cirq_cv, qdtypes=ctrl_spec.qdtypes, shapes=ctrl_spec.shapes)
+            == ctrl_spec
+        )
 
 
 def test_ctrl_bloq_as_cirq_op():
@@ -173,6 +214,14 @@ def test_ctrl_spec_activation_4():
     cspec3 = CtrlSpec([QInt(32), QInt(64)], cvs=[np.array(1234), np.array(234234)])
     assert cspec3.is_active(1234, 234234)
     assert not cspec3.is_active(12345, 432432)
+    assert not cspec3.is_active(1234, 432432)
+
+    cspec4 = CtrlSpec(
+        [QUInt(64), QInt(64)], cvs=[np.array(2**63 + 4, dtype=np.uint64), np.array(-1)]
+    )
+    assert cspec4.is_active(np.uint64(2**63 + 4), -1)
+    assert not cspec4.is_active(np.uint64(2**63 + 5), -1)
+    assert not cspec4.is_active(np.uint64(2**63 + 4), -2)
 
 
 def test_controlled_serial():
@@ -418,6 +467,18 @@ def test_controlled_tensor_for_and_bloq(ctrl_spec: CtrlSpec):
     _verify_ctrl_tensor_for_and(ctrl_spec, (0, 0))
 
 
+def test_controlled_tensor_data_cached_only_when_small():
+    small = Controlled(XGate(), CtrlSpec())
+    assert small._tensor_data is small._tensor_data
+
+    big = Controlled(XGate(), CtrlSpec(qdtypes=QUInt(8), cvs=3))
+    assert big.signature.n_qubits() == 9
+    data = big._tensor_data
+    assert data is not big._tensor_data
+    assert big._active_idx is big._active_idx
+    np.testing.assert_array_equal(data, big._tensor_data)
+
+
 def test_controlled_diagrams():
     ctrl_gate = XPowGate(0.25).controlled()
     cirq.testing.assert_has_diagram(
@@ -11,8 +11,6 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import itertools
-
 import cirq
 import numpy as np
 
@@ -60,14 +58,12 @@ _c(2): ───X───X───""",
 def test_classical_sim():
     tof = Toffoli()
 
-    for c0, c1 in itertools.product([0, 1], repeat=2):
-        ctrl, target = tof.call_classically(ctrl=np.asarray([c0, c1]), target=0)
+    all_ctrls = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+    for ctrl_in in all_ctrls:
+        ctrl, target = tof.call_classically(ctrl=ctrl_in, target=0)
         assert isinstance(ctrl, np.ndarray)
-        assert ctrl.tolist() == [c0, c1]
-        if c0 == 1 and c1 == 1:
-            assert target == 1
-        else:
-            assert target == 0
+        assert ctrl.tolist() == ctrl_in.tolist()
+        assert target == ctrl_in[0] & ctrl_in[1]
 
 
 def test_classical_sim_2():
@@ -26,7 +26,7 @@ from qualtran.bloqs.mean_estimation.complex_phase_oracle import ComplexPhaseOrac
 from qualtran.bloqs.reflections.reflection_using_prepare import ReflectionUsingPrepare
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class CodeForRandomVariable:
     r"""A collection of `encoder` and `synthesizer` for a random variable y.
 
@@ -59,10 +59,13 @@ class CodeForRandomVariable:
     encoder: SelectOracle
 
     def __attrs_post_init__(self):
-        assert self.synthesizer.selection_registers == self.encoder.selection_registers
+        sel_regs = self.synthesizer.selection_registers
+        assert sel_regs is self.encoder.selection_registers or (
+            sel_regs == self.encoder.selection_registers
+        )
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class MeanEstimationOperator(SpecializedSingleQubitControlledGate):
     r"""Mean estimation operator $U=REFL_{p} ROT_{y}$ as per Sec 3.1 of arxiv.org:2208.07544.
 
@@ -95,6 +98,14 @@ class MeanEstimationOperator(SpecializedSingleQubitControlledGate):
     def select(self) -> ComplexPhaseOracle:
         return ComplexPhaseOracle(self.code.encoder, self.arctan_bitsize)
 
+    @cached_property
+    def _select_reg_names(self) -> Tuple[str, ...]:
+        return tuple(reg.name for reg in self.select.signature)
+
+    @cached_property
+    def _reflect_reg_names(self) -> Tuple[str, ...]:
+        return tuple(reg.name for reg in self.reflect.signature)
+
     @cached_property
     def control_registers(self) -> Tuple[Register, ...]:
         return self.code.encoder.control_registers
@@ -113,8 +124,8 @@ class MeanEstimationOperator(SpecializedSingleQubitControlledGate):
         context: cirq.DecompositionContext,
         **quregs: NDArray[cirq.Qid],  # type:ignore[type-var]
     ) -> Iterator[cirq.OP_TREE]:
-        select_reg = {reg.name: quregs[reg.name] for reg in self.select.signature}
-        reflect_reg = {reg.name: quregs[reg.name] for reg in self.reflect.signature}
+        select_reg = {name: quregs[name] for name in self._select_reg_names}
+        reflect_reg = {name: quregs[name] for name in self._reflect_reg_names}
         yield self.select.on_registers(**select_reg)
         yield self.reflect.on_registers(**reflect_reg)
 
@@ -155,8 +155,10 @@ def get_flame_graph_data(
 
     data = []
     for bloq in bloqs:
-        call_graph, _ = bloq.call_graph(keep=keep, **kwargs, generalizer=cirq_to_bloqs)
-        call_graph_t_counts, _ = bloq.call_graph()
+        call_graph, _ = bloq.call_graph(
+            keep=keep, **kwargs, generalizer=cirq_to_bloqs, compute_sigma=False
+        )
+        call_graph_t_counts, _ = bloq.call_graph(compute_sigma=False)
         data += _populate_flame_graph_data(bloq, call_graph, call_graph_t_counts, prefix=[])
     if file_path:
         with open(file_path, 'w') as f:
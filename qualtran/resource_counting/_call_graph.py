@@ -15,8 +15,9 @@
 """Functionality for the `Bloq.call_graph()` protocol."""
 
 import collections.abc
-from collections import defaultdict
-from typing import Callable, cast, Dict, List, Optional, Sequence, Set, Tuple, Union
+import functools
+from collections import Counter, defaultdict
+from typing import Any, Callable, cast, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
 import networkx as nx
 import sympy
@@ -27,11 +28,16 @@ BloqCountT = Tuple[Bloq, Union[int, sympy.Expr]]
 from ._generalization import _make_composite_generalizer, GeneralizerT
 
 
+@functools.lru_cache(maxsize=1024)
+def _infinite_limits(free_symbols: FrozenSet[sympy.Symbol]) -> Tuple[Tuple[sympy.Symbol, Any], ...]:
+    return tuple((var, sympy.oo) for var in free_symbols)
+
+
 def big_O(expr) -> sympy.Order:
     """Helper to deal with CS-style big-O notation that takes the infinite limit by default."""
     if isinstance(expr, (int, float)):
         return sympy.Order(expr)
-    return sympy.Order(expr, *[(var, sympy.oo) for var in expr.free_symbols])
+    return sympy.Order(expr, *_infinite_limits(frozenset(expr.free_symbols)))
 
 
 class SympySymbolAllocator:
@@ -48,9 +54,9 @@ class SympySymbolAllocator:
 
     def new_symbol(self, prefix: str) -> sympy.Symbol:
         """Return a unique symbol beginning with _prefix."""
-        s = sympy.Symbol(f'_{prefix}{self._idxs[prefix]}')
-        self._idxs[prefix] += 1
-        return s
+        idx = self._idxs[prefix]
+        self._idxs[prefix] = idx + 1
+        return sympy.Symbol(f'_{prefix}{idx}')
 
 
 def build_cbloq_call_graph(cbloq: CompositeBloq) -> Set[BloqCountT]:
@@ -61,11 +67,12 @@ def build_cbloq_call_graph(cbloq: CompositeBloq) -> Set[BloqCountT]:
     Args:
         cbloq: The composite bloq.
     """
-    counts: Dict[Bloq, int] = defaultdict(lambda: 0)
-    for binst in cbloq.bloq_instances:
-        counts[binst.bloq] += 1
+    return set(Counter(binst.bloq for binst in cbloq.bloq_instances).items())
 
-    return {(bloq, n) for bloq, n in counts.items()}
+
+def _identity_generalizer(b: Bloq) -> Bloq:
+    """The default generalizer, which `_generalize_callees` knows it can skip."""
+    return b
 
 
 def _generalize_callees(
@@ -76,13 +83,20 @@ def _generalize_callees(
     This calls `generalizer` on each of the callees returned from that function,
     and filters out cases where `generalizer` returns `None`.
     """
-    callee_counts: Dict[Bloq, Union[int, sympy.Expr]] = defaultdict(lambda: 0)
+    callee_counts: Dict[Bloq, Union[int, sympy.Expr]] = {}
+    if generalizer is _identity_generalizer:
+        for callee, n in raw_callee_counts:
+            prev = callee_counts.get(callee)
+            callee_counts[callee] = n if prev is None else prev + n
+        return list(callee_counts.items())
+
     for callee, n in raw_callee_counts:
         generalized_callee = generalizer(callee)
         if generalized_callee is None:
             # Signifies that this callee should be ignored.
             continue
-        callee_counts[generalized_callee] += n
+        prev = callee_counts.get(generalized_callee)
+        callee_counts[generalized_callee] = n if prev is None else prev + n
     return list(callee_counts.items())
 
 
@@ -108,14 +122,21 @@ def get_bloq_callee_counts(
         A list of (bloq, n) bloq counts.
     """
     if generalizer is None:
-        generalizer = lambda b: b
+        generalizer = _identity_generalizer
     if isinstance(generalizer, (list, tuple)):
         generalizer = _make_composite_generalizer(*generalizer)
     if ssa is None:
         ssa = SympySymbolAllocator()
 
+    return _get_bloq_callee_counts(bloq, cast(GeneralizerT, generalizer), ssa)
+
+
+def _get_bloq_callee_counts(
+    bloq: Bloq, generalizer: GeneralizerT, ssa: SympySymbolAllocator
+) -> List[BloqCountT]:
+    """`get_bloq_callee_counts` for an already-resolved generalizer and allocator."""
     try:
-        return _generalize_callees(bloq.build_call_graph(ssa), cast(GeneralizerT, generalizer))
+        return _generalize_callees(bloq.build_call_graph(ssa), generalizer)
     except (DecomposeNotImplementedError, DecomposeTypeError):
         return []
 
@@ -128,68 +149,126 @@ def _build_call_graph(
     max_depth: Optional[int],
     g: nx.DiGraph,
     depth: int,
-) -> None:
-    """Recursively build the call graph.
+) -> List[Bloq]:
+    """Build the call graph with an iterative depth-first traversal.
+
+    Arguments are the same as `get_bloq_call_graph`, except `g` is the empty graph we're
+    building (i.e. it is mutated by this function) and `depth` is the depth of `bloq`.
+
+    Returns:
+        The nodes of `g` in depth-first post-order, i.e. every bloq comes after all its callees.
+    """
+    # Stack entries are (bloq, depth, expanded); an `expanded` entry marks that all of
+    # the bloq's callees have been finished once it is popped.
+    stack: List[Tuple[Bloq, int, bool]] = [(bloq, depth, False)]
+    # Nodes and edges are collected during the traversal and added to `g` in bulk at the end.
+    # `visited` is a dict rather than a set so that node insertion order is preserved.
+    visited: Dict[Bloq, None] = {}
+    # Bloqs that have been expanded but whose callees are not all finished yet, i.e. the
+    # current path from the root. Reaching one of these again means the graph has a cycle.
+    in_progress: Set[Bloq] = set()
+    edges: List[Tuple[Bloq, Bloq, Dict[str, Union[int, sympy.Expr]]]] = []
+    post_order: List[Bloq] = []
+    while stack:
+        bloq, depth, expanded = stack.pop()
+        if expanded:
+            in_progress.remove(bloq)
+            post_order.append(bloq)
+            continue
+
+        if bloq in in_progress:
+            raise nx.NetworkXUnfeasible(f"The call graph contains a cycle through {bloq}.")
+
+        if bloq in visited:
+            # We already visited this node.
+            continue
+
+        # Make sure this node is present in the graph.
+        visited[bloq] = None
+
+        # Leaf case 1: This node is requested by the user to be a leaf node via `keep`.
+        if keep(bloq):
+            post_order.append(bloq)
+            continue
+
+        # Leaf case 2: Max depth exceeded
+        if max_depth is not None and depth >= max_depth:
+            post_order.append(bloq)
+            continue
+
+        # Get the callees and modify them according to `generalizer`. Like
+        # `get_bloq_callee_counts`, each bloq gets a fresh symbol allocator.
+        callee_counts = _get_bloq_callee_counts(bloq, generalizer, SympySymbolAllocator())
 
-    Arguments are the same as `get_bloq_call_graph`, except `g` is the graph we're building
-    (i.e. it is mutated by this function) and `depth` is the current recursion depth.
+        # Push callees in reverse so they are visited in order, like a recursive traversal.
+        stack.append((bloq, depth, True))
+        in_progress.add(bloq)
+        for callee, n in reversed(callee_counts):
+            stack.append((callee, depth + 1, False))
+        edges.extend((bloq, callee, {'n': n}) for callee, n in callee_counts)
+
+    # Add the nodes first so `g` keeps them in visiting order. Each caller is expanded once and
+    # its callees are de-duplicated by `_generalize_callees`, so every edge is added exactly once.
+    g.add_nodes_from(visited)
+    g.add_edges_from(edges)
+
+    return post_order
+
+
+def _compute_sigma(
+    root_bloq: Bloq, g: nx.DiGraph, post_order: Optional[Sequence[Bloq]] = None
+) -> Dict[Bloq, Union[int, sympy.Expr]]:
+    """Iterate over nodes to sum up the counts of leaf bloqs.
+
+    Nodes are visited callees-first. `post_order` is the traversal order returned by
+    `_build_call_graph` when `g` was built from `root_bloq`; if it is not provided, a reversed
+    topological sort of `g` is used.
+
+    A callee's sigma is dropped once its last caller has been processed. If that caller calls it
+    exactly once and has not accumulated anything yet, it takes over the dictionary instead of
+    copying it.
     """
-    if bloq in g:
-        # We already visited this node.
-        return
-
-    # Make sure this node is present in the graph.
-    g.add_node(bloq)
-
-    # Base case 1: This node is requested by the user to be a leaf node via the `keep` parameter.
-    if keep(bloq):
-        return
-
-    # Base case 2: Max depth exceeded
-    if max_depth is not None and depth >= max_depth:
-        return
-
-    # Prep for recursion: get the callees and modify them according to `generalizer`.
-    callee_counts = get_bloq_callee_counts(bloq, generalizer)
-
-    # Base case 3: Empty list of callees
-    if not callee_counts:
-        return
-
-    for callee, n in callee_counts:
-        # Quite important: we do the recursive call first before adding in the edges.
-        # Otherwise, adding the edge would mark the callee node as already-visited by
-        # virtue of it being added to the graph with the `g.add_edge` call.
-
-        # Do the recursive step, which will continue to mutate `g`
-        _build_call_graph(callee, generalizer, ssa, keep, max_depth, g, depth + 1)
-
-        # Update edge in `g`
-        if (bloq, callee) in g.edges:
-            g.edges[bloq, callee]['n'] += n
-        else:
-            g.add_edge(bloq, callee, n=n)
-
-
-def _compute_sigma(root_bloq: Bloq, g: nx.DiGraph) -> Dict[Bloq, Union[int, sympy.Expr]]:
-    """Iterate over nodes to sum up the counts of leaf bloqs."""
-    bloq_sigmas: Dict[Bloq, Dict[Bloq, Union[int, sympy.Expr]]] = defaultdict(
-        lambda: defaultdict(lambda: 0)
-    )
-    for bloq in reversed(list(nx.topological_sort(g))):
-        callees = list(g.successors(bloq))
-        sigma = bloq_sigmas[bloq]
+    if g.in_degree(root_bloq):
+        # `root_bloq` is an interior node of `g`; only its descendants contribute to its sigma.
+        g = g.subgraph(nx.descendants(g, root_bloq) | {root_bloq})
+
+    bloq_sigmas: Dict[Bloq, Dict[Bloq, Union[int, sympy.Expr]]] = {}
+    n_callers_left: Dict[Bloq, int] = dict(g.in_degree())
+    if post_order is None:
+        post_order = list(reversed(list(nx.topological_sort(g))))
+    for bloq in post_order:
+        callees = g.succ[bloq]
         if not callees:
             # 1. `bloq` is a leaf node. Its count is one of itself.
-            sigma[bloq] = 1
+            bloq_sigmas[bloq] = {bloq: 1}
             continue
 
-        for callee in callees:
-            callee_sigma = bloq_sigmas[callee]
+        sigma: Dict[Bloq, Union[int, sympy.Expr]] = {}
+        # Symbolic terms are summed in one `sympy.Add` per leaf rather than pairwise.
+        symbolic_terms: Dict[Bloq, List[sympy.Expr]] = {}
+        for callee, edge in callees.items():
+            n = edge['n']
+            n_callers_left[callee] -= 1
+            if n_callers_left[callee] == 0:
+                callee_sigma = bloq_sigmas.pop(callee)
+                if not sigma and n == 1:
+                    # Nothing else reads `callee_sigma`, so re-use it as our accumulator.
+                    sigma = callee_sigma
+                    continue
+            else:
+                callee_sigma = bloq_sigmas[callee]
+
             # 2. Otherwise, sigma of the caller is sum(n * sigma of callee) for all the callees.
-            n = g.edges[bloq, callee]['n']
-            for k in callee_sigma.keys():
-                sigma[k] += callee_sigma[k] * n
+            for k, v in callee_sigma.items():
+                term = v * n
+                if isinstance(term, sympy.Basic):
+                    sigma.setdefault(k, 0)
+                    symbolic_terms.setdefault(k, []).append(term)
+                else:
+                    sigma[k] = sigma.get(k, 0) + term
+        for k, terms in symbolic_terms.items():
+            sigma[k] = sympy.Add(sigma[k], *terms)
+        bloq_sigmas[bloq] = sigma
 
     return dict(bloq_sigmas[root_bloq])
 
@@ -200,6 +279,7 @@ def get_bloq_call_graph(
     ssa: Optional[SympySymbolAllocator] = None,
     keep: Optional[Callable[[Bloq], bool]] = None,
     max_depth: Optional[int] = None,
+    compute_sigma: bool = True,
 ) -> Tuple[nx.DiGraph, Dict[Bloq, Union[int, sympy.Expr]]]:
     """Recursively build the bloq call graph and call totals.
 
@@ -217,6 +297,8 @@ def get_bloq_call_graph(
         keep: If this function evaluates to True for the current bloq, keep the bloq as a leaf
             node in the call graph instead of recursing into it.
         max_depth: If provided, build a call graph with at most this many layers.
+        compute_sigma: If False, skip summing up the call totals and return an empty `sigma`.
+            Use this if only the graph is needed.
 
     Returns:
         g: A directed graph where nodes are (generalized) bloqs and edge attribute 'n' reports
@@ -230,7 +312,7 @@ def get_bloq_call_graph(
     if keep is None:
         keep = lambda b: False
     if generalizer is None:
-        generalizer = lambda b: b
+        generalizer = _identity_generalizer
     if isinstance(generalizer, collections.abc.Sequence):
         generalizer = _make_composite_generalizer(*generalizer)
 
@@ -238,8 +320,10 @@ def get_bloq_call_graph(
     bloq = generalizer(bloq)
     if bloq is None:
         raise ValueError("You can't generalize away the root bloq.")
-    _build_call_graph(bloq, generalizer, ssa, keep, max_depth, g=g, depth=0)
-    sigma = _compute_sigma(bloq, g)
+    post_order = _build_call_graph(bloq, generalizer, ssa, keep, max_depth, g=g, depth=0)
+    if not compute_sigma:
+        return g, {}
+    sigma = _compute_sigma(bloq, g, post_order)
     return g, sigma
 
 
@@ -31,6 +31,7 @@ from qualtran.resource_counting import (
     get_bloq_callee_counts,
     SympySymbolAllocator,
 )
+from qualtran.resource_counting._call_graph import _compute_sigma
 from qualtran.resource_counting.generalizers import generalize_rotation_angle
 from qualtran.symbolics import SymbolicInt
 
@@ -189,6 +190,39 @@ def test_diamond_graph_generalize():
     assert sigma == {'c': 2}
 
 
+def test_diamond_graph_no_sigma():
+    bloq, _ = make_diamond_graph()
+    graph, sigma = bloq.call_graph(compute_sigma=False)
+    edgeset = {(n1.name, n2.name, graph.edges[n1, n2]['n']) for n1, n2 in graph.edges}
+
+    assert edgeset == {('a', 'b1', 1), ('a', 'b2', 1), ('b1', 'c', 1), ('b2', 'c', 1)}
+    assert sigma == {}
+
+
+def test_compute_sigma_interior_root():
+    bloq, _ = make_diamond_graph()
+    graph, _ = bloq.call_graph()
+    nodes = {node.name: node for node in graph.nodes}
+
+    assert _compute_sigma(nodes['b1'], graph) == {nodes['c']: 1}
+    assert _compute_sigma(nodes['c'], graph) == {nodes['c']: 1}
+    assert _compute_sigma(bloq, graph) == {nodes['c']: 2}
+
+
+def test_call_graph_cycle():
+    bloq, _ = make_diamond_graph()
+
+    def c_to_root(b):
+        if b.name == 'c':
+            return bloq
+        return b
+
+    with pytest.raises(nx.NetworkXUnfeasible, match='cycle'):
+        bloq.call_graph(generalizer=c_to_root)
+    with pytest.raises(nx.NetworkXUnfeasible, match='cycle'):
+        bloq.call_graph(generalizer=c_to_root, compute_sigma=False)
+
+
 def make_funnel_graph():
     c = OnlyCallGraphBloqShim('c')
     b = OnlyCallGraphBloqShim('b', callees=[(c, 1)])
@@ -21,6 +21,22 @@ GeneralizerT = Callable[['Bloq'], Optional['Bloq']]
 
 def _make_composite_generalizer(*funcs: 'GeneralizerT') -> 'GeneralizerT':
     """Return a generalizer that calls each `*funcs` generalizers in order."""
+    if len(funcs) == 1:
+        return funcs[0]
+
+    if len(funcs) == 2:
+        # Unrolled version of the loop below for the common case of a pair of generalizers.
+        func0, func1 = funcs
+
+        def _generalize_pair(b: Optional['Bloq']) -> Optional['Bloq']:
+            if b is None:
+                return None
+            b = func0(b)
+            if b is None:
+                return None
+            return func1(b)
+
+        return _generalize_pair
 
     def _composite_generalize(b: Optional['Bloq']) -> Optional['Bloq']:
         for func in funcs:
@@ -14,7 +14,7 @@
 from typing import Optional
 
 from qualtran import Bloq
-from qualtran.bloqs.for_testing import TestAtom
+from qualtran.bloqs.for_testing import TestAtom, TestTwoBitOp
 from qualtran.resource_counting._generalization import _make_composite_generalizer
 
 
@@ -44,3 +44,8 @@ def test_make_composite_generalizer():
     assert g01(b) is None
     assert g11(b) is None
     assert g11_r(b) is None
+
+    g111 = _make_composite_generalizer(func1, func1, func2)
+    assert g111(b) is None
+    for gg in [g00, g10, g01, g11, g11_r, g111]:
+        assert gg(TestTwoBitOp()) == TestTwoBitOp()